@@ -38,6 +38,7 @@ from databricks_cli.dbfs.dbfs_path import DbfsPath
 from databricks_cli.dbfs.exceptions import LocalFileExistsException
 
 BUFFER_SIZE_BYTES = 2**20
+NUM_FILES_DELETED_RE = re.compile(r".*operation has deleted (\d+) files.*")
 
 
 class ParseException(Exception):
@@ -139,7 +140,7 @@ class DbfsApi(object):
             message = partial_delete_error.response.json()['message']
         except (AttributeError, KeyError):
             raise ParseException("Unable to retrieve the number of deleted files.")
-        m = re.compile(r".*operation has deleted (\d+) files.*").match(message)
+        m = NUM_FILES_DELETED_RE.match(message)
         if not m:
             raise ParseException(
                 "Unable to retrieve the number of deleted files from the error message: {}".format(